@@ -1,117 +1,173 @@
 import sys
+import argparse
+import importlib.util
 import subprocess
-import oci
-from oci.monitoring.models import SummarizeMetricsDataDetails
-import pandas as pd
-from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Font, PatternFill
+try:
+    import oci
+    from oci.monitoring.models import SummarizeMetricsDataDetails
+    from oci.resource_search.models import StructuredSearchDetails
+    import xlsxwriter
+    import orjson
+except ImportError as e:
+    sys.exit(f"Missing required package '{e.name}'. Install the dependencies with: pip install -r requirements.txt")
+# kubernetes is only imported by scan_cluster (it adds ~0.2s to startup), but a missing install should still fail up front
+if importlib.util.find_spec("kubernetes") is None:
+    sys.exit("Missing required package 'kubernetes'. Install the dependencies with: pip install -r requirements.txt")
 import os
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import logging
 import tempfile
-import json
+import hashlib
 import shutil
+import threading
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from contextlib import nullcontext
+from functools import lru_cache, partial, wraps
+from typing import NamedTuple
 
 oci_path = shutil.which("oci")
-kubectl_path = shutil.which("kubectl")
-
-total_instances = 0
-total_instance_sizeGB = 0
-total_instance_sizeTB = 0
-total_namespaces = 0
-total_buckets = 0
-total_storageGB = 0
-total_storageTB = 0
-total_db_systems = 0
-total_db_system_sizeGB = 0
-total_db_system_sizeTB = 0
-total_oke_clusters = 0
-total_oke_node_count = 0
-total_oke_pvc_count = 0
-total_oke_pvc_size_gb = 0
-total_oke_pvc_size_tb = 0
-
-class InstanceInfo:
-    def __init__(self):
-        self.compartment_id = None
-        self.instance_id = None
-        self.instance_name = None
-        self.region = None
-        self.availability_domain = None
-        self.shape = None
-        self.state = None
-        self.number_of_volumes = 0
-        self.sizeGB = 0
-        self.sizeTB = 0
-        self.defined_tags = {}
-        self.freeform_tags = {}
-        self.boot_volume_name = None
-        self.block_volume_names = []
+
+MAX_OCI_WORKERS = 32
+oci_call_semaphore = threading.Semaphore(MAX_OCI_WORKERS)
+MAX_BUCKET_WORKERS = 32
+bucket_call_semaphore = threading.Semaphore(MAX_BUCKET_WORKERS)
+# Each cluster scan mints an OCI auth token for its kubeconfig, so keep this low
+MAX_CLUSTER_WORKERS = 8
+kubeconfig_semaphore = threading.Semaphore(MAX_CLUSTER_WORKERS)
+
+# Same retry decision as the SDK's default strategy: timeouts, connection errors, 409 IncorrectState/LockConflict,
+# 429 and 5xx other than 501
+RETRY_CHECKER = oci.retry.retry_checkers.TimeoutConnectionAndServiceErrorRetryChecker()
+# Every OCI call is wrapped in retry_on_throttle, so the SDK must not retry underneath it
+NO_SDK_RETRY = oci.retry.NoneRetryStrategy()
+# The one-off identity calls at startup abort the whole run on failure, so they keep the SDK default's budget
+STARTUP_RETRY_BUDGET = {"max_attempts": 8, "max_elapsed": 600.0}
+
+BUCKET_METRICS_WINDOW = timedelta(days=1)
+
+COMPARTMENT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "cv-oci-sizing")
+COMPARTMENT_CACHE_TTL = timedelta(hours=24)
+
+# Sizes are carried as integer bytes and only converted (and rounded) when a row is built
+BYTES_PER_GB = 1024 ** 3
+BYTES_PER_TB = 1024 ** 4
+
+K8S_QUANTITY_MULTIPLIERS = {
+    "Ki": 1024, "Mi": 1024 ** 2, "Gi": 1024 ** 3, "Ti": 1024 ** 4, "Pi": 1024 ** 5, "Ei": 1024 ** 6,
+    "k": 1000, "M": 1000 ** 2, "G": 1000 ** 3, "T": 1000 ** 4, "P": 1000 ** 5, "E": 1000 ** 6,
+    "": 1,
+}
+
+# constant_memory streams each row to disk as soon as the next one starts, so rows must go in top to bottom.
+# Tag dumps and bucket names are data, not formulas or links
+WORKBOOK_OPTIONS = {"constant_memory": True, "strings_to_formulas": False, "strings_to_urls": False}
+HEADER_FORMAT = {"bold": True, "bg_color": "#DDDDDD"}
+BOLD_FORMAT = {"bold": True}
+
+class WorkloadRows:
+    def __init__(self, workload):
+        _, _, info_headers, summary_headers = get_sheet_info(workload)
+        self.info_rows = []
+        self.info_column_widths = [len(header) for header in info_headers]
+        self.summary_rows = []
+        self.summary_column_widths = [len(header) for header in summary_headers]
+        self.grand_total_row = None
+
+@dataclass
+class InstanceTotals:
+    count: int = 0
+    size_bytes: int = 0
+
+@dataclass
+class ObjectStorageTotals:
+    count: int = 0
+    size_bytes: int = 0
+
+@dataclass
+class DBSystemTotals:
+    count: int = 0
+    size_bytes: int = 0
+
+@dataclass
+class OKEClusterTotals:
+    count: int = 0
+    node_count: int = 0
+    pvc_count: int = 0
+    pvc_size_bytes: int = 0
+
+class InstanceInfo(NamedTuple):
+    compartment_id: str
+    instance_id: str
+    instance_name: str
+    region: str
+    availability_domain: str
+    shape: str
+    state: str
+    number_of_volumes: int
+    size_bytes: int
+    defined_tags: dict
+    freeform_tags: dict
+    boot_volume_name: str
+    block_volume_names: list
 
 class InstanceSummary:
     def __init__(self):
         self.region = None
         self.instance_count = 0
-        self.total_sizeGB = 0
-        self.total_sizeTB = 0
+        self.total_size_bytes = 0
 
-class ObjectStorageInfo:
-    def __init__(self):
-        self.compartment_id = None
-        self.namespace = None
-        self.bucket_name = None
-        self.region = None
-        self.storage_tier = None
-        self.object_count = 0
-        self.sizeGB = 0
-        self.sizeTB = 0
-        self.defined_tags = {}
-        self.freeform_tags = {}
+class ObjectStorageInfo(NamedTuple):
+    compartment_id: str
+    namespace: str
+    bucket_name: str
+    region: str
+    data_tiers: str
+    object_count: int
+    size_bytes: int
+    defined_tags: dict
+    freeform_tags: dict
 
 class ObjectStorageSummary:
     def __init__(self):
         self.region = None
         self.namespace = None
         self.bucket_count = 0
-        self.total_storage_GB = 0
-        self.total_storage_TB = 0
+        self.total_storage_bytes = 0
 
-class DBSystemInfo:
-    def __init__(self):
-        self.compartment_id = None
-        self.db_system_id = None
-        self.display_name = None
-        self.region = None
-        self.availability_domain = None
-        self.shape = None
-        self.lifecycle_state = None
-        self.node_count = 0
-        self.db_version = None
-        self.database_edition = None
-        self.data_storage_size_gb = 0
-        self.data_storage_size_tb = 0
-        self.defined_tags = {}
-        self.freeform_tags = {}
+class DBSystemInfo(NamedTuple):
+    compartment_id: str
+    db_system_id: str
+    display_name: str
+    region: str
+    availability_domain: str
+    shape: str
+    lifecycle_state: str
+    node_count: int
+    db_version: str
+    database_edition: str
+    data_storage_size_bytes: int
+    defined_tags: dict
+    freeform_tags: dict
 
 class DBSystemSummary:
     def __init__(self):
         self.region = None
         self.db_system_count = 0
-        self.total_storage_gb = 0
-        self.total_storage_tb = 0
+        self.total_storage_bytes = 0
 
-class OKEClusterInfo:
-    def __init__(self):
-        self.region = None
-        self.cluster_id = None
-        self.cluster_name = None
-        self.kubernetes_version = None
-        self.node_count = 0
-        self.node_names = []
-        self.pvc_count = 0
-        self.pvc_names = []
-        self.total_pvc_size_gb = 0
-        self.total_pvc_size_tb = 0
+class OKEClusterInfo(NamedTuple):
+    region: str
+    cluster_id: str
+    cluster_name: str
+    kubernetes_version: str
+    node_count: int
+    node_names: list
+    pvc_count: int
+    pvc_names: list
+    total_pvc_size_bytes: int
 
 class OKEClusterSummary:
     def __init__(self):
@@ -119,342 +175,529 @@ class OKEClusterSummary:
         self.cluster_count = 0
         self.total_node_count = 0
         self.total_pvc_count = 0
-        self.total_pvc_size_gb = 0
-        self.total_pvc_size_tb = 0
+        self.total_pvc_size_bytes = 0
 
 
-def install_and_import(package):
+def get_retry_after(error):
+    headers = getattr(error, "headers", None) or {}
     try:
-        __import__(package)
-        print(f"Package '{package}' is already installed.")
-    except ImportError:
-        print(f"Package '{package}' not found. Installing...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+        return float(headers.get("retry-after") or headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
 
-def get_sheet_info(workload):
-    if workload == "instances":
-        info_sheet = "Instance Info"
-        summary_sheet = "Instance Summary"
-        info_headers = [
+def retry_on_throttle(max_attempts=5, base=1.0, cap=32.0, max_elapsed=30.0, semaphore=None):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.monotonic()
+            for attempt in range(max_attempts):
+                try:
+                    # The slot is held per attempt only, so a backing-off call doesn't block other workers
+                    with semaphore or nullcontext():
+                        return func(*args, **kwargs)
+                except Exception as e:
+                    if not RETRY_CHECKER.should_retry(exception=e) or attempt == max_attempts - 1:
+                        raise
+                    # Retry-After is honoured as given; the elapsed budget decides whether it is worth waiting for
+                    delay = get_retry_after(e)
+                    if delay is None:
+                        delay = min(cap, base * 2 ** attempt) + random.uniform(0, 0.5)
+                    if time.monotonic() - start + delay > max_elapsed:
+                        raise
+                    if isinstance(e, oci.exceptions.ServiceError):
+                        reason = f"{e.status} {e.code}"
+                    else:
+                        reason = f"{type(e).__name__}: {e}"
+                    logging.warning(f"OCI call failed with {reason}, retrying in {delay:.1f}s (attempt {attempt + 1}/{max_attempts})")
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+
+SHEET_INFO = {
+    "instances": (
+        "Instance Info",
+        "Instance Summary",
+        (
             "Compartment ID", "Instance ID", "Instance Name", "Region",
             "Availability Domain", "Shape", "State", "Number of Volumes",
             "Size (GB)", "Size (TB)", "Boot Volume Name", "Block Volume Names", "Defined Tags", "Freeform Tags"
-        ]
-        summary_headers = ["Region", "Instance Count", "Total Size (GB)", "Total Size (TB)"]
-    elif workload == "object_storage":
-        info_sheet = "Object Storage Info"
-        summary_sheet = "Object Storage Summary"
-        info_headers = [
+        ),
+        ("Region", "Instance Count", "Total Size (GB)", "Total Size (TB)"),
+    ),
+    "object_storage": (
+        "Object Storage Info",
+        "Object Storage Summary",
+        (
             "Namespace", "Compartment ID", "Bucket Name", "Region",
-            "Storage Tier", "Object Count", "Size (GB)", "Size (TB)",
+            "Tiers With Data", "Object Count", "Size (GB)", "Size (TB)",
             "Defined Tags", "Freeform Tags"
-        ]
-        summary_headers = ["Region", "Bucket Count", "Total Size (GB)", "Total Size (TB)"]
-    elif workload == "db_systems":
-        info_sheet = "DB System Info"
-        summary_sheet = "DB System Summary"
-        info_headers = [
+        ),
+        ("Region", "Bucket Count", "Total Size (GB)", "Total Size (TB)"),
+    ),
+    "db_systems": (
+        "DB System Info",
+        "DB System Summary",
+        (
             "Compartment ID", "DB System ID", "Display Name", "Region",
             "Availability Domain", "Shape", "Lifecycle State", "Node Count",
             "DB Version", "Database Edition", "Data Storage Size (GB)", "Data Storage Size (TB)",
             "Defined Tags", "Freeform Tags"
-        ]
-        summary_headers = ["Region", "DB System Count", "Total Storage (GB)", "Total Storage (TB)"]
-    elif workload == "oke_clusters":
-        info_sheet = "OKE Cluster Info"
-        summary_sheet = "OKE Cluster Summary"
-        info_headers = [
+        ),
+        ("Region", "DB System Count", "Total Storage (GB)", "Total Storage (TB)"),
+    ),
+    "oke_clusters": (
+        "OKE Cluster Info",
+        "OKE Cluster Summary",
+        (
             "Region", "Cluster ID", "Cluster Name", "Kubernetes Version",
             "Node Count", "PVC Count", "Total PVC Size (GB)", "Total PVC Size (TB)",
             "PVC Names",  "Node Names"
-        ]
-        summary_headers = [
+        ),
+        (
             "Region", "Cluster Count", "Total Node Count",
             "Total PVC Count", "Total PVC Size (GB)", "Total PVC Size (TB)"
-        ]
-    else:
-        raise ValueError(f"Unsupported workload: {workload}")
+        ),
+    ),
+}
 
-    return info_sheet, summary_sheet, info_headers, summary_headers
+def get_sheet_info(workload):
+    try:
+        return SHEET_INFO[workload]
+    except KeyError:
+        raise ValueError(f"Unsupported workload: {workload}") from None
 
-def format_workbook(filename):
-    wb = load_workbook(filename)
-    header_fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-    bold_font = Font(bold=True)
+def update_column_widths(column_widths, row):
+    for i, value in enumerate(row):
+        if value:
+            column_widths[i] = max(column_widths[i], len(str(value)))
 
-    for sheet in wb.worksheets:
-        # Format header row
-        for cell in sheet[1]:
-            cell.font = bold_font
-            cell.fill = header_fill
+def get_workload_rows(report, workload):
+    if workload not in report:
+        report[workload] = WorkloadRows(workload)
+    return report[workload]
 
-        # Adjust column widths
-        for column_cells in sheet.columns:
-            max_length = 0
-            col = column_cells[0].column_letter
-            for cell in column_cells:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-            adjusted_width = max_length + 2
-            sheet.column_dimensions[col].width = adjusted_width
-    wb.save(filename)
-
-def init_excel(filename, workload):
-    if not os.path.exists(filename):
-        wb = Workbook()
-        wb.remove(wb.active)  # Remove default sheet
-        
+def write_sheet(wb, formats, sheet_name, headers, rows, column_widths, grand_total_row=None):
+    header_format, bold_format = formats
+    sheet = wb.add_worksheet(sheet_name)
+
+    for i, width in enumerate(column_widths):
+        sheet.set_column(i, i, width + 2)
+
+    sheet.write_row(0, 0, headers, header_format)
+    row_index = 1
+    if grand_total_row:
+        sheet.write_row(row_index, 0, grand_total_row, bold_format)
+        row_index += 1
+    # Data rows go in unformatted; only the header and grand total are styled
+    for row in rows:
+        sheet.write_row(row_index, 0, row)
+        row_index += 1
+
+def save_workbook(filename, report):
+    wb = xlsxwriter.Workbook(filename, WORKBOOK_OPTIONS)
+    # Formats belong to a workbook, so they are created per save rather than at module level
+    formats = (wb.add_format(HEADER_FORMAT), wb.add_format(BOLD_FORMAT))
+    for workload, workload_rows in report.items():
         info_sheet, summary_sheet, info_headers, summary_headers = get_sheet_info(workload)
+        write_sheet(wb, formats, summary_sheet, summary_headers, workload_rows.summary_rows,
+                    workload_rows.summary_column_widths, workload_rows.grand_total_row)
+        write_sheet(wb, formats, info_sheet, info_headers, workload_rows.info_rows, workload_rows.info_column_widths)
+    wb.close()
+
+def bytes_to_gb(size_bytes):
+    return round(size_bytes / BYTES_PER_GB, 2)
+
+def bytes_to_tb(size_bytes):
+    return round(size_bytes / BYTES_PER_TB, 2)
 
-        wb.create_sheet(summary_sheet)
-        wb.create_sheet(info_sheet)
+INFO_ROW_BUILDERS = {
+    "instances": lambda obj: (
+        obj.compartment_id,
+        obj.instance_id,
+        obj.instance_name,
+        obj.region,
+        obj.availability_domain,
+        obj.shape,
+        obj.state,
+        obj.number_of_volumes,
+        bytes_to_gb(obj.size_bytes),
+        bytes_to_tb(obj.size_bytes),
+        obj.boot_volume_name if obj.boot_volume_name else "",
+        ", ".join(obj.block_volume_names) if obj.block_volume_names else "",
+        str(obj.defined_tags),
+        str(obj.freeform_tags),
+    ),
+    "object_storage": lambda obj: (
+        obj.namespace,
+        obj.compartment_id,
+        obj.bucket_name,
+        obj.region,
+        obj.data_tiers,
+        obj.object_count,
+        bytes_to_gb(obj.size_bytes),
+        bytes_to_tb(obj.size_bytes),
+        str(obj.defined_tags),
+        str(obj.freeform_tags),
+    ),
+    "db_systems": lambda obj: (
+        obj.compartment_id,
+        obj.db_system_id,
+        obj.display_name,
+        obj.region,
+        obj.availability_domain,
+        obj.shape,
+        obj.lifecycle_state,
+        obj.node_count,
+        obj.db_version,
+        obj.database_edition,
+        bytes_to_gb(obj.data_storage_size_bytes),
+        bytes_to_tb(obj.data_storage_size_bytes),
+        str(obj.defined_tags),
+        str(obj.freeform_tags),
+    ),
+    "oke_clusters": lambda obj: (
+        obj.region,
+        obj.cluster_id,
+        obj.cluster_name,
+        obj.kubernetes_version,
+        obj.node_count,
+        obj.pvc_count,
+        bytes_to_gb(obj.total_pvc_size_bytes),
+        bytes_to_tb(obj.total_pvc_size_bytes),
+        ", ".join(obj.pvc_names) if obj.pvc_names else "",
+        ", ".join(obj.node_names) if obj.node_names else "",
+    ),
+}
 
-        wb[info_sheet].append(info_headers)
-        wb[summary_sheet].append(summary_headers)
-        wb.save(filename)
+SUMMARY_ROW_BUILDERS = {
+    "instances": lambda obj: (
+        obj.region,
+        obj.instance_count,
+        bytes_to_gb(obj.total_size_bytes),
+        bytes_to_tb(obj.total_size_bytes),
+    ),
+    "object_storage": lambda obj: (
+        obj.region,
+        obj.bucket_count,
+        bytes_to_gb(obj.total_storage_bytes),
+        bytes_to_tb(obj.total_storage_bytes),
+    ),
+    "db_systems": lambda obj: (
+        obj.region,
+        obj.db_system_count,
+        bytes_to_gb(obj.total_storage_bytes),
+        bytes_to_tb(obj.total_storage_bytes),
+    ),
+    "oke_clusters": lambda obj: (
+        obj.region,
+        obj.cluster_count,
+        obj.total_node_count,
+        obj.total_pvc_count,
+        bytes_to_gb(obj.total_pvc_size_bytes),
+        bytes_to_tb(obj.total_pvc_size_bytes),
+    ),
+}
 
-def dump_info(filename, workload, object_list: list):
-    info_sheet, _, _, _ = get_sheet_info(workload)
-    wb = load_workbook(filename)
-    sheet = wb[info_sheet]
+def dump_info(report, workload, object_list: list):
+    workload_rows = get_workload_rows(report, workload)
+    build_row = INFO_ROW_BUILDERS[workload]
 
     for obj in object_list:
-        if workload == "instances":
-            row = [
-                obj.compartment_id,
-                obj.instance_id,
-                obj.instance_name,
-                obj.region,
-                obj.availability_domain,
-                obj.shape,
-                obj.state,
-                obj.number_of_volumes,
-                obj.sizeGB,
-                obj.sizeTB,
-                obj.boot_volume_name if obj.boot_volume_name else "",
-                ", ".join(obj.block_volume_names) if obj.block_volume_names else "",
-                str(obj.defined_tags),
-                str(obj.freeform_tags),
-            ]
-        elif workload == "object_storage":
-            row = [
-                obj.namespace,
-                obj.compartment_id,
-                obj.bucket_name,
-                obj.region,
-                obj.storage_tier,
-                obj.object_count,
-                obj.sizeGB,
-                obj.sizeTB,
-                str(obj.defined_tags),
-                str(obj.freeform_tags),
-            ]
-        elif workload == "db_systems":
-            row = [
-                obj.compartment_id,
-                obj.db_system_id,
-                obj.display_name,
-                obj.region,
-                obj.availability_domain,
-                obj.shape,
-                obj.lifecycle_state,
-                obj.node_count,
-                obj.db_version,
-                obj.database_edition,
-                obj.data_storage_size_gb,
-                obj.data_storage_size_tb,
-                str(obj.defined_tags),
-                str(obj.freeform_tags),
-            ]
-        elif workload == "oke_clusters":
-            row = [
-                obj.region,
-                obj.cluster_id,
-                obj.cluster_name,
-                obj.kubernetes_version,
-                obj.node_count,
-                obj.pvc_count,
-                obj.total_pvc_size_gb,
-                obj.total_pvc_size_tb,
-                ", ".join(obj.pvc_names) if obj.pvc_names else "",
-                ", ".join(obj.node_names) if obj.node_names else "",
-            ]
-        else:
-            raise ValueError(f"Unsupported workload: {workload}")
-        sheet.append(row)
-    wb.save(filename)
-
-def dump_summary(filename, workload, summary):
-    _, summary_sheet, _, _ = get_sheet_info(workload)
-    wb = load_workbook(filename)
-    sheet = wb[summary_sheet]
+        row = build_row(obj)
+        update_column_widths(workload_rows.info_column_widths, row)
+        workload_rows.info_rows.append(row)
+
+def dump_summary(report, workload, summary):
+    workload_rows = get_workload_rows(report, workload)
+    build_row = SUMMARY_ROW_BUILDERS[workload]
 
     for obj in summary:
-        if workload == "instances":
-            row = [
-                obj.region,
-                obj.instance_count,
-                obj.total_sizeGB,
-                obj.total_sizeTB,
-            ]
-        elif workload == "object_storage":
-            row = [
-                obj.region,
-                obj.bucket_count,
-                obj.total_storage_GB,
-                obj.total_storage_TB,
-            ]
-        elif workload == "db_systems":
-            row = [
-                obj.region,
-                obj.db_system_count,
-                obj.total_storage_gb,
-                obj.total_storage_tb,
-            ]
-        elif workload == "oke_clusters":
-            row = [
-                obj.region,
-                obj.cluster_count,
-                obj.total_node_count,
-                obj.total_pvc_count,
-                obj.total_pvc_size_gb,
-                obj.total_pvc_size_tb
-            ]
-        else:
-            raise ValueError(f"Unsupported workload: {workload}")
-        sheet.append(row)
-
-    wb.save(filename)
-
-def write_grand_total(filename, workload):
-    wb = load_workbook(filename)
-
-    bold_font = Font(bold=True)
+        row = build_row(obj)
+        update_column_widths(workload_rows.summary_column_widths, row)
+        workload_rows.summary_rows.append(row)
+
+def write_grand_total(report, workload, totals):
     if workload == "instances":
-        global total_instances, total_instance_sizeGB, total_instance_sizeTB
-        sheet_name = "Instance Summary"
-        row = ["Total Instances", total_instances, total_instance_sizeGB, total_instance_sizeTB]
+        row = ("Total Instances", totals.count, bytes_to_gb(totals.size_bytes), bytes_to_tb(totals.size_bytes))
     elif workload == "object_storage":
-        sheet_name = "Object Storage Summary"
-        global total_namespaces, total_buckets, total_storageGB, total_storageTB
-        row = ["Total Buckets", total_buckets, total_storageGB, total_storageTB]
+        row = ("Total Buckets", totals.count, bytes_to_gb(totals.size_bytes), bytes_to_tb(totals.size_bytes))
     elif workload == "db_systems":
-        sheet_name = "DB System Summary"
-        global total_db_systems, total_db_system_sizeGB, total_db_system_sizeTB
-        row = ["Total DB Systems", total_db_systems, total_db_system_sizeGB, total_db_system_sizeTB]
+        row = ("Total DB Systems", totals.count, bytes_to_gb(totals.size_bytes), bytes_to_tb(totals.size_bytes))
     elif workload == "oke_clusters":
-        sheet_name = "OKE Cluster Summary"
-        global total_oke_clusters, total_oke_node_count, total_oke_pvc_count
-        global total_oke_pvc_size_gb, total_oke_pvc_size_tb
-        row = [
+        row = (
             "Total OKE Clusters",
-            total_oke_clusters,
-            total_oke_node_count,
-            total_oke_pvc_count,
-            total_oke_pvc_size_gb,
-            total_oke_pvc_size_tb
-        ]
+            totals.count,
+            totals.node_count,
+            totals.pvc_count,
+            bytes_to_gb(totals.pvc_size_bytes),
+            bytes_to_tb(totals.pvc_size_bytes)
+        )
     else:
         raise ValueError(f"Unsupported workload: {workload}")
 
-    sheet = wb[sheet_name]
-    sheet.append(row)
-    for cell in sheet[2]:
-        cell.font = bold_font
-    wb.save(filename)
+    workload_rows = get_workload_rows(report, workload)
+    update_column_widths(workload_rows.summary_column_widths, row)
+    workload_rows.grand_total_row = row
 
-def get_object_storage_info(config, filename, regions=[], compartments=[]):
-    global total_buckets, total_storageGB, total_storageTB
-    object_storage_summary_list = []
-    identity_client = oci.identity.IdentityClient(config)
-    if not regions:
-        regions = [region.region_name for region in identity_client.list_region_subscriptions(config["tenancy"]).data]
-    if not compartments:
-        compartments = [compartment.id for compartment in identity_client.list_compartments(compartment_id=config["tenancy"], compartment_id_in_subtree=True).data]
-    for region in regions:
-        logging.info(f"Processing region: {region}")
-        config["region"] = region
-        object_storage_client = oci.object_storage.ObjectStorageClient(config)
-        region_summary = ObjectStorageSummary()
-        region_summary.region = region
-        region_summary.bucket_count = 0
-        region_summary.total_storage_GB = 0
-        region_summary.total_storage_TB = 0
-        try:
-            namespace = object_storage_client.get_namespace().data
-        except Exception as e:
-            logging.error(f"Error fetching namespace for region {region}: {e}")
-            continue
-        for compartment in compartments:
-            compartment_bucket_list = []
+def freeze_config(config):
+    # lru_cache needs hashable arguments; OCI config values are plain strings
+    return tuple(sorted(config.items()))
+
+@lru_cache(maxsize=1)
+def get_identity_client(frozen_config):
+    return oci.identity.IdentityClient(dict(frozen_config))
+
+# Keyed per region; the workloads in an --workload=all run share one search client (and its connection pool) per region
+@lru_cache(maxsize=None)
+def get_search_client(frozen_region_config):
+    return oci.resource_search.ResourceSearchClient(dict(frozen_region_config))
+
+@lru_cache(maxsize=1)
+def get_all_regions(frozen_config):
+    tenancy = dict(frozen_config)["tenancy"]
+    identity_client = get_identity_client(frozen_config)
+    region_subscriptions = retry_on_throttle(**STARTUP_RETRY_BUDGET)(identity_client.list_region_subscriptions)(tenancy, retry_strategy=NO_SDK_RETRY).data
+    return tuple(region.region_name for region in region_subscriptions)
+
+def get_compartment_cache_file(config):
+    # Visible compartments depend on the caller's policies, so key on the user as well as the tenancy
+    cache_key = hashlib.sha256(f"{config['tenancy']}:{config.get('user', '')}".encode()).hexdigest()[:16]
+    return os.path.join(COMPARTMENT_CACHE_DIR, f"compartments-{cache_key}.json")
+
+def read_compartment_cache(cache_file):
+    try:
+        age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(cache_file))
+        if age > COMPARTMENT_CACHE_TTL:
+            return None
+        with open(cache_file, "rb") as f:
+            return tuple(orjson.loads(f.read()))
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def write_compartment_cache(cache_file, compartments):
+    try:
+        os.makedirs(COMPARTMENT_CACHE_DIR, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            f.write(orjson.dumps(list(compartments)))
+    except OSError as e:
+        logging.warning(f"Could not write compartment cache {cache_file}: {e}")
+
+@lru_cache(maxsize=1)
+def get_all_compartments(frozen_config):
+    config = dict(frozen_config)
+    cache_file = get_compartment_cache_file(config)
+    compartments = read_compartment_cache(cache_file)
+    if compartments is not None:
+        logging.info(f"Using {len(compartments)} cached compartment(s) from {cache_file}")
+        return compartments
+
+    identity_client = get_identity_client(frozen_config)
+    compartments = tuple(compartment.id for compartment in oci.pagination.list_call_get_all_results(
+        retry_on_throttle(**STARTUP_RETRY_BUDGET)(identity_client.list_compartments),
+        compartment_id=config["tenancy"],
+        compartment_id_in_subtree=True,
+        lifecycle_state="ACTIVE",
+        retry_strategy=NO_SDK_RETRY
+    ).data)
+    write_compartment_cache(cache_file, compartments)
+    return compartments
+
+def get_compartments_with_resources(region_config, resource_type, compartments, condition=None):
+    # One indexed search per region replaces a list call against every compartment that has nothing in it
+    search_client = get_search_client(freeze_config(region_config))
+    query = f"query {resource_type} resources"
+    if condition:
+        query += f" where {condition}"
+    search_details = StructuredSearchDetails(
+        type="Structured",
+        query=query,
+        matching_context_type="NONE"
+    )
+    try:
+        resources = oci.pagination.list_call_get_all_results(
+            retry_on_throttle()(search_client.search_resources),
+            search_details,
+            retry_strategy=NO_SDK_RETRY
+        ).data
+    except Exception as e:
+        logging.warning(f"Resource search for {resource_type} failed in region {region_config['region']}, scanning all compartments: {e}")
+        return compartments
+    compartments_with_resources = {resource.compartment_id for resource in resources}
+    filtered = [compartment for compartment in compartments if compartment in compartments_with_resources]
+    logging.info(f"Found {resource_type} resources in {len(filtered)} of {len(compartments)} compartment(s) in region {region_config['region']}")
+    return filtered
+
+def scan_regions(process_region, config, regions, compartments):
+    # Regions are independent endpoints, so scan them concurrently and hand results back in region order
+    with ThreadPoolExecutor(max_workers=max(len(regions), 1)) as executor:
+        return list(executor.map(partial(process_region, config, compartments), regions))
+
+def get_bucket_metrics(monitoring_client, compartment):
+    # Object Storage publishes per-bucket StoredBytes/ObjectCount metrics, one series per bucket and tier
+    end_time = datetime.now(timezone.utc)
+    start_time = end_time - BUCKET_METRICS_WINDOW
+    bucket_metrics = {}
+    for metric_name in ("StoredBytes", "ObjectCount"):
+        details = SummarizeMetricsDataDetails(
+            namespace="oci_objectstorage",
+            query=f"{metric_name}[1h].max()",
+            # Without this the service defaults to 1m resolution and returns ~1440 overlapping points per stream
+            resolution="1h",
+            start_time=start_time,
+            end_time=end_time
+        )
+        metric_data = retry_on_throttle()(monitoring_client.summarize_metrics_data)(
+            compartment_id=compartment,
+            summarize_metrics_data_details=details,
+            retry_strategy=NO_SDK_RETRY
+        ).data
+        for metric in metric_data:
+            if not metric.aggregated_datapoints:
+                continue
+            bucket_name = metric.dimensions.get("resourceDisplayName")
+            metrics = bucket_metrics.setdefault(bucket_name, {"StoredBytes": 0, "ObjectCount": 0, "tiers": set()})
+            metrics[metric_name] += metric.aggregated_datapoints[-1].value
+            if metric.dimensions.get("tier"):
+                metrics["tiers"].add(metric.dimensions["tier"])
+    return bucket_metrics
+
+def fetch_bucket_stats(object_storage_client, namespace, compartment, region, bucket):
+    try:
+        stats = retry_on_throttle(semaphore=bucket_call_semaphore)(object_storage_client.get_bucket)(
+            namespace_name=namespace,
+            bucket_name=bucket.name,
+            fields=['approximateSize', 'approximateCount'],
+            retry_strategy=NO_SDK_RETRY
+        ).data
+        size_in_bytes, object_count = stats.approximate_size, stats.approximate_count
+        return ObjectStorageInfo(
+            compartment_id=compartment,
+            namespace=namespace,
+            bucket_name=bucket.name,
+            region=region,
+            # get_bucket only reports the configured default tier, not where the data sits
+            data_tiers="",
+            object_count=object_count,
+            size_bytes=size_in_bytes or 0,
+            defined_tags=stats.defined_tags,
+            freeform_tags=stats.freeform_tags,
+        )
+    except Exception as e:
+        logging.error(f"Error fetching stats for bucket {bucket.name}: {e}")
+        return None
+
+def bucket_info_from_metrics(bucket, metrics, compartment, namespace, region):
+    return ObjectStorageInfo(
+        compartment_id=compartment,
+        namespace=namespace,
+        bucket_name=bucket.name,
+        region=region,
+        data_tiers=", ".join(sorted(metrics["tiers"])),
+        object_count=int(metrics["ObjectCount"]),
+        size_bytes=int(metrics["StoredBytes"]),
+        defined_tags=bucket.defined_tags,
+        freeform_tags=bucket.freeform_tags,
+    )
+
+def process_object_storage_region(config, compartments, region):
+    logging.info(f"Processing region: {region}")
+    region_config = dict(config, region=region)
+    object_storage_client = oci.object_storage.ObjectStorageClient(region_config)
+    monitoring_client = oci.monitoring.MonitoringClient(region_config)
+    compartments = get_compartments_with_resources(region_config, "bucket", compartments)
+    region_summary = ObjectStorageSummary()
+    region_summary.region = region
+    region_bucket_list = []
+    try:
+        namespace = retry_on_throttle()(object_storage_client.get_namespace)(retry_strategy=NO_SDK_RETRY).data
+    except Exception as e:
+        logging.error(f"Error fetching namespace for region {region}: {e}")
+        return None, region_bucket_list
+    for compartment in compartments:
+        bucket_metrics = None
+        bucket_results = []
+        with ThreadPoolExecutor(max_workers=MAX_BUCKET_WORKERS) as executor:
             try:
-                buckets = oci.pagination.list_call_get_all_results(
-                    object_storage_client.list_buckets,
+                # Buckets are handled page by page as they arrive, so stats calls overlap the remaining pagination
+                for bucket in oci.pagination.list_call_get_all_results_generator(
+                    retry_on_throttle()(object_storage_client.list_buckets),
+                    "record",
                     namespace_name=namespace,
-                    compartment_id=compartment
-                ).data
+                    compartment_id=compartment,
+                    fields=["tags"],
+                    retry_strategy=NO_SDK_RETRY
+                ):
+                    if bucket_metrics is None:
+                        try:
+                            bucket_metrics = get_bucket_metrics(monitoring_client, compartment)
+                        except Exception as e:
+                            logging.warning(f"Error fetching bucket metrics for compartment {compartment}, falling back to per-bucket stats: {e}")
+                            bucket_metrics = {}
+                    if bucket.name in bucket_metrics:
+                        bucket_results.append(bucket_info_from_metrics(bucket, bucket_metrics[bucket.name], compartment, namespace, region))
+                    else:
+                        # Buckets without metrics yet (new or empty) still need a get_bucket call
+                        bucket_results.append(executor.submit(fetch_bucket_stats, object_storage_client, namespace, compartment, region, bucket))
             except Exception as e:
                 logging.error(f"Error fetching buckets for compartment {compartment}: {e}")
                 continue
-            logging.info(f"Found {len(buckets)} bucket(s) in compartment {compartment}")
-            if len(buckets) == 0:
+        logging.info(f"Found {len(bucket_results)} bucket(s) in compartment {compartment}")
+        bucket_infos = [result.result() if isinstance(result, Future) else result for result in bucket_results]
+        for bucket_info in bucket_infos:
+            if bucket_info is None:
                 continue
-            for bucket in buckets:
-                bucket_info = ObjectStorageInfo()
-                bucket_info.compartment_id = compartment
-                bucket_info.namespace = namespace
-                bucket_info.bucket_name = bucket.name
-                bucket_info.region = region
-                try:
-                    stats = object_storage_client.get_bucket(
-                        namespace_name=namespace,
-                        bucket_name=bucket.name,
-                        fields=['approximateSize', 'approximateCount']
-                    ).data
-                    bucket_info.storage_tier = stats.storage_tier
-                    bucket_info.defined_tags = stats.defined_tags
-                    bucket_info.freeform_tags = stats.freeform_tags
-                    size_in_bytes, object_count = stats.approximate_size, stats.approximate_count
-                    bucket_info.sizeGB = round(size_in_bytes / (1024 ** 3), 2) if size_in_bytes else 0
-                    bucket_info.sizeTB = round(bucket_info.sizeGB / 1024, 2) if bucket_info.sizeGB else 0
-                    bucket_info.object_count = object_count
-                except Exception as e:
-                    logging.error(f"Error fetching stats for bucket {bucket.name}: {e}")
-                    continue
-                region_summary.bucket_count += 1
-                region_summary.total_storage_GB += bucket_info.sizeGB if bucket_info.sizeGB else 0
-                region_summary.total_storage_TB += bucket_info.sizeTB if bucket_info.sizeTB else 0
-                compartment_bucket_list.append(bucket_info)
-                total_buckets += 1
-                total_storageGB += bucket_info.sizeGB if bucket_info.sizeGB else 0
-                total_storageTB += bucket_info.sizeTB if bucket_info.sizeTB else 0
-            dump_info(filename, "object_storage", compartment_bucket_list)
+            region_summary.bucket_count += 1
+            region_summary.total_storage_bytes += bucket_info.size_bytes
+            region_bucket_list.append(bucket_info)
+    return region_summary, region_bucket_list
+
+def get_object_storage_info(config, report, regions=[], compartments=[], profile=oci.config.DEFAULT_PROFILE):
+    totals = ObjectStorageTotals()
+    object_storage_summary_list = []
+    if not regions:
+        regions = get_all_regions(freeze_config(config))
+    if not compartments:
+        compartments = get_all_compartments(freeze_config(config))
+    for region_summary, region_bucket_list in scan_regions(process_object_storage_region, config, regions, compartments):
+        if region_summary is None:
+            continue
+        dump_info(report, "object_storage", region_bucket_list)
         object_storage_summary_list.append(region_summary)
-        
-    write_grand_total(filename, "object_storage")
-    dump_summary(filename, "object_storage", object_storage_summary_list)
-    format_workbook(filename)
+        totals.count += region_summary.bucket_count
+        totals.size_bytes += region_summary.total_storage_bytes
+
+    write_grand_total(report, "object_storage", totals)
+    dump_summary(report, "object_storage", object_storage_summary_list)
     logging.info("Completed processing all regions and compartments for object storage.")
-    logging.info(f"Grand Total - Buckets: {total_buckets}, Size (GB): {total_storageGB}, Size (TB): {total_storageTB}")
+    logging.info(f"Grand Total - Buckets: {totals.count}, Size (GB): {bytes_to_gb(totals.size_bytes)}, Size (TB): {bytes_to_tb(totals.size_bytes)}")
+    return totals
+
+def get_compartment_volumes(block_storage_client, compartment_id):
+    # Block and boot volume OCIDs never collide, so one lookup table serves both attachment types
+    volumes = {}
+    for list_method in (block_storage_client.list_volumes, block_storage_client.list_boot_volumes):
+        for volume in oci.pagination.list_call_get_all_results(retry_on_throttle()(list_method),
+                                                              compartment_id=compartment_id,
+                                                              retry_strategy=NO_SDK_RETRY).data:
+            volumes[volume.id] = {"name": volume.display_name, "sizeGB": volume.size_in_gbs}
+    return volumes
 
-def get_boot_volume_info(config, instance_id, availability_domain, compartment_id):
-    compute_client = oci.core.ComputeClient(config)
-    block_storage_client = oci.core.BlockstorageClient(config)
+def get_boot_volume_info(compute_client, block_storage_client, volumes, instance_id, availability_domain, compartment_id):
     try:
-        response = oci.pagination.list_call_get_all_results(compute_client.list_boot_volume_attachments,
+        response = oci.pagination.list_call_get_all_results(retry_on_throttle(semaphore=oci_call_semaphore)(compute_client.list_boot_volume_attachments),
                                                             instance_id=instance_id,
                                                             availability_domain=availability_domain,
                                                             compartment_id=compartment_id,
-                                                            retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY)
+                                                            retry_strategy=NO_SDK_RETRY)
         boot_volumes = response.data
         result = {"name": None, "sizeGB": 0}
         if not boot_volumes:
             return result
+        if boot_volumes[0].boot_volume_id in volumes:
+            return volumes[boot_volumes[0].boot_volume_id]
+        # Volume lives outside the instance's compartment, so it wasn't in the bulk listing
         try:
-            response = block_storage_client.get_boot_volume(boot_volumes[0].boot_volume_id)
+            response = retry_on_throttle(semaphore=oci_call_semaphore)(block_storage_client.get_boot_volume)(boot_volumes[0].boot_volume_id, retry_strategy=NO_SDK_RETRY)
             boot_volume_info = response.data
             result = {"name": boot_volume_info.display_name, "sizeGB": boot_volume_info.size_in_gbs}
             return result
@@ -465,22 +708,23 @@ def get_boot_volume_info(config, instance_id, availability_domain, compartment_i
         print(f"Error retrieving boot volume attachments for instance {instance_id}: {e}")
         return {"name": None, "sizeGB": 0}
 
-def get_block_volume_info(config, instance_id, availability_domain, compartment_id):
-    compute_client = oci.core.ComputeClient(config)
-    block_storage_client = oci.core.BlockstorageClient(config)
+def get_block_volume_info(compute_client, block_storage_client, volumes, instance_id, availability_domain, compartment_id):
     try:
-        response = oci.pagination.list_call_get_all_results(compute_client.list_volume_attachments,
+        response = oci.pagination.list_call_get_all_results(retry_on_throttle(semaphore=oci_call_semaphore)(compute_client.list_volume_attachments),
                                                             instance_id=instance_id,
                                                             availability_domain=availability_domain,
                                                             compartment_id=compartment_id,
-                                                            retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY)
+                                                            retry_strategy=NO_SDK_RETRY)
         volume_attachments = response.data
         result = []
         if not volume_attachments:
             return result
         for attachment in volume_attachments:
+            if attachment.volume_id in volumes:
+                result.append(volumes[attachment.volume_id])
+                continue
             try:
-                response = block_storage_client.get_volume(attachment.volume_id)
+                response = retry_on_throttle(semaphore=oci_call_semaphore)(block_storage_client.get_volume)(attachment.volume_id, retry_strategy=NO_SDK_RETRY)
                 volume_info = response.data
                 result.append({"name": volume_info.display_name, "sizeGB": volume_info.size_in_gbs})
             except Exception as e:
@@ -490,303 +734,323 @@ def get_block_volume_info(config, instance_id, availability_domain, compartment_
         print(f"Error retrieving volume attachments for instance {instance_id}: {e}")
         return []
 
-def get_instance_info(config, filename, regions=[], compartments=[]):
-    global total_instances, total_instance_sizeGB, total_instance_sizeTB
+def fetch_volumes(compute_client, block_storage_client, volumes, instance):
+    try:
+        boot_volume_info = get_boot_volume_info(compute_client, block_storage_client, volumes, instance.id, instance.availability_domain, instance.compartment_id)
+        block_volumes_info = get_block_volume_info(compute_client, block_storage_client, volumes, instance.id, instance.availability_domain, instance.compartment_id)
+    except Exception as e:
+        logging.error(f"Error fetching volume data for instance {instance.id}: {e}")
+        return instance, None, None
+    return instance, boot_volume_info, block_volumes_info
+
+def process_instance_region(config, compartments, region):
+    logging.info(f"Processing region: {region}")
+    region_config = dict(config, region=region)
+    compute_client = oci.core.ComputeClient(region_config)
+    block_storage_client = oci.core.BlockstorageClient(region_config)
+    compartments = get_compartments_with_resources(region_config, "instance", compartments, "lifecycleState != 'TERMINATED'")
+    region_summary = InstanceSummary()
+    region_summary.region = region
+    region_instance_list = []
+    live_instances = []
+    volumes = {}
+    for compartment in compartments:
+        logging.info(f"Processing compartment: {compartment}")
+        try:
+            instances = oci.pagination.list_call_get_all_results(retry_on_throttle()(compute_client.list_instances),
+                                                                compartment_id=compartment,
+                                                                retry_strategy=NO_SDK_RETRY).data
+        except Exception as e:
+            logging.error(f"Error fetching instances for compartment {compartment}: {e}")
+            continue
+        logging.info(f"Found {len(instances)} instance(s)")
+        compartment_instances = [instance for instance in instances if instance.lifecycle_state != "TERMINATED"]
+        if not compartment_instances:
+            continue
+        live_instances.extend(compartment_instances)
+        try:
+            volumes.update(get_compartment_volumes(block_storage_client, compartment))
+        except Exception as e:
+            logging.warning(f"Error listing volumes for compartment {compartment}, falling back to per-volume lookups: {e}")
+
+    # One pool for the whole region so small compartments don't leave workers idle
+    with ThreadPoolExecutor(max_workers=MAX_OCI_WORKERS) as executor:
+        volume_results = list(executor.map(partial(fetch_volumes, compute_client, block_storage_client, volumes), live_instances))
+    for instance, boot_volume_info, block_volumes_info in volume_results:
+        if boot_volume_info is None:
+            continue
+        logging.info(f"Processing instance: {instance.id} - {instance.display_name}")
+        # Volume APIs report whole GB
+        size_bytes = (boot_volume_info["sizeGB"] + sum([bv["sizeGB"] for bv in block_volumes_info])) * BYTES_PER_GB
+        instance_info = InstanceInfo(
+            compartment_id=instance.compartment_id,
+            instance_id=instance.id,
+            instance_name=instance.display_name,
+            region=region,
+            availability_domain=instance.availability_domain,
+            shape=instance.shape,
+            state=instance.lifecycle_state,
+            number_of_volumes=(1 if boot_volume_info["sizeGB"] > 0 else 0) + len(block_volumes_info),
+            size_bytes=size_bytes,
+            defined_tags=instance.defined_tags,
+            freeform_tags=instance.freeform_tags,
+            boot_volume_name=boot_volume_info["name"] if boot_volume_info["name"] else None,
+            block_volume_names=[bv["name"] for bv in block_volumes_info],
+        )
+        region_summary.instance_count += 1
+        region_summary.total_size_bytes += instance_info.size_bytes
+        region_instance_list.append(instance_info)
+    return region_summary, region_instance_list
+
+def get_instance_info(config, report, regions=[], compartments=[], profile=oci.config.DEFAULT_PROFILE):
+    totals = InstanceTotals()
     instance_summary_list = []
-    identity_client = oci.identity.IdentityClient(config)
-    if not regions: 
-        regions = [region.region_name for region in identity_client.list_region_subscriptions(config["tenancy"]).data]
+    if not regions:
+        regions = get_all_regions(freeze_config(config))
     if not compartments:
-        compartments = [compartment.id for compartment in identity_client.list_compartments(compartment_id=config["tenancy"], compartment_id_in_subtree=True).data]
-    for region in regions:
-        logging.info(f"Processing region: {region}")
-        config["region"] = region
-        compute_client = oci.core.ComputeClient(config)
-        region_summary = InstanceSummary()
-        for compartment in compartments:
-            logging.info(f"Processing compartment: {compartment}")
-            compartment_instance_list = []
-            region_summary.region = region
-            instances = oci.pagination.list_call_get_all_results(compute_client.list_instances,
-                                                                compartment_id=compartment,
-                                                                retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY).data
-            logging.info(f"Found {len(instances)} instance(s)")
-            if len(instances) == 0:
-                continue
-            for instance in instances:
-                if instance.lifecycle_state == "TERMINATED":
-                    continue
-                logging.info(f"Processing instance: {instance.id} - {instance.display_name}")
-                instance_info = InstanceInfo()
-                instance_info.compartment_id = compartment
-                instance_info.instance_id = instance.id
-                instance_info.instance_name = instance.display_name
-                instance_info.region = region
-                instance_info.availability_domain = instance.availability_domain
-                instance_info.shape = instance.shape
-                instance_info.state = instance.lifecycle_state
-                instance_info.defined_tags = instance.defined_tags
-                instance_info.freeform_tags = instance.freeform_tags
-                try:
-                    boot_volume_info = get_boot_volume_info(config, instance.id, instance.availability_domain, instance.compartment_id)
-                    block_volumes_info = get_block_volume_info(config, instance.id, instance.availability_domain, instance.compartment_id)
-                except Exception as e:
-                    logging.error(f"Error fetching volume data for instance {instance.id}: {e}")
-                    continue
-                instance_info.number_of_volumes = (1 if boot_volume_info["sizeGB"] > 0 else 0) + len(block_volumes_info)
-                instance_info.sizeGB = boot_volume_info["sizeGB"] + sum([bv["sizeGB"] for bv in block_volumes_info])
-                instance_info.sizeTB = round(instance_info.sizeGB / 1024, 2)
-                instance_info.boot_volume_name = boot_volume_info["name"] if boot_volume_info["name"] else None
-                instance_info.block_volume_names = [bv["name"] for bv in block_volumes_info]
-                region_summary.instance_count += 1
-                region_summary.total_sizeGB += instance_info.sizeGB
-                region_summary.total_sizeTB += instance_info.sizeTB
-                compartment_instance_list.append(instance_info)
-                total_instances += 1
-                total_instance_sizeGB += instance_info.sizeGB
-                total_instance_sizeTB += instance_info.sizeTB
-            dump_info(filename, "instances", compartment_instance_list)
+        compartments = get_all_compartments(freeze_config(config))
+    for region_summary, region_instance_list in scan_regions(process_instance_region, config, regions, compartments):
+        dump_info(report, "instances", region_instance_list)
         instance_summary_list.append(region_summary)
-    write_grand_total(filename, "instances")
-    dump_summary(filename, "instances", instance_summary_list)
-    format_workbook(filename)
+        totals.count += region_summary.instance_count
+        totals.size_bytes += region_summary.total_size_bytes
+    write_grand_total(report, "instances", totals)
+    dump_summary(report, "instances", instance_summary_list)
     logging.info("Completed processing all regions and compartments.")
-    logging.info(f"Grand Total - Instances: {total_instances}, Size (GB): {total_instance_sizeGB}, Size (TB): {total_instance_sizeTB}")
+    logging.info(f"Grand Total - Instances: {totals.count}, Size (GB): {bytes_to_gb(totals.size_bytes)}, Size (TB): {bytes_to_tb(totals.size_bytes)}")
+    return totals
 
-def get_database_info(config, filename, regions=[], compartments=[]):
-    global total_db_systems, total_db_system_sizeGB, total_db_system_sizeTB
+def process_database_region(config, compartments, region):
+    logging.info(f"Processing region: {region}")
+    region_config = dict(config, region=region)
+    db_client = oci.database.DatabaseClient(region_config)
+    compartments = get_compartments_with_resources(region_config, "dbsystem", compartments, "lifecycleState != 'TERMINATED'")
+    region_summary = DBSystemSummary()
+    region_summary.region = region
+    region_db_list = []
+    for compartment in compartments:
+        logging.info(f"Processing compartment: {compartment}")
+        try:
+            db_systems = oci.pagination.list_call_get_all_results(
+                retry_on_throttle()(db_client.list_db_systems),
+                compartment_id=compartment,
+                retry_strategy=NO_SDK_RETRY
+            ).data
+        except Exception as e:
+            logging.error(f"Error fetching DB systems for compartment {compartment}: {e}")
+            continue
+        logging.info(f"Found {len(db_systems)} DB system(s)")
+        if len(db_systems) == 0:
+            continue
+        for db in db_systems:
+            if db.lifecycle_state == "TERMINATED":
+                continue
+            data_storage_size_bytes = (getattr(db, "data_storage_size_in_gbs", None) or 0) * BYTES_PER_GB
+            db_info = DBSystemInfo(
+                compartment_id=compartment,
+                db_system_id=db.id,
+                display_name=db.display_name,
+                region=region,
+                availability_domain=db.availability_domain,
+                shape=db.shape,
+                lifecycle_state=db.lifecycle_state,
+                node_count=db.node_count if hasattr(db, "node_count") else 0,
+                db_version=db.version if hasattr(db, "version") else "",
+                database_edition=db.database_edition if hasattr(db, "database_edition") else "",
+                data_storage_size_bytes=data_storage_size_bytes,
+                defined_tags=db.defined_tags,
+                freeform_tags=db.freeform_tags,
+            )
+            region_summary.db_system_count += 1
+            region_summary.total_storage_bytes += db_info.data_storage_size_bytes
+            region_db_list.append(db_info)
+    return region_summary, region_db_list
+
+def get_database_info(config, report, regions=[], compartments=[], profile=oci.config.DEFAULT_PROFILE):
+    totals = DBSystemTotals()
     db_summary_list = []
-    identity_client = oci.identity.IdentityClient(config)
     if not regions:
-        regions = [region.region_name for region in identity_client.list_region_subscriptions(config["tenancy"]).data]
+        regions = get_all_regions(freeze_config(config))
     if not compartments:
-        compartments = [compartment.id for compartment in identity_client.list_compartments(compartment_id=config["tenancy"], compartment_id_in_subtree=True).data]
-    for region in regions:
-        logging.info(f"Processing region: {region}")
-        config["region"] = region
-        db_client = oci.database.DatabaseClient(config)
-        region_summary = DBSystemSummary()
-        region_summary.region = region
-        for compartment in compartments:
-            logging.info(f"Processing compartment: {compartment}")
-            compartment_db_list = []
-            try:
-                db_systems = oci.pagination.list_call_get_all_results(
-                    db_client.list_db_systems,
-                    compartment_id=compartment
-                ).data
-            except Exception as e:
-                logging.error(f"Error fetching DB systems for compartment {compartment}: {e}")
-                continue
-            logging.info(f"Found {len(db_systems)} DB system(s)")
-            if len(db_systems) == 0:
-                continue
-            for db in db_systems:
-                if db.lifecycle_state == "TERMINATED":
-                    continue
-                db_info = DBSystemInfo()
-                db_info.compartment_id = compartment
-                db_info.db_system_id = db.id
-                db_info.display_name = db.display_name
-                db_info.region = region
-                db_info.availability_domain = db.availability_domain
-                db_info.shape = db.shape
-                db_info.lifecycle_state = db.lifecycle_state
-                db_info.node_count = db.node_count if hasattr(db, "node_count") else 0
-                db_info.db_version = db.version if hasattr(db, "version") else ""
-                db_info.database_edition = db.database_edition if hasattr(db, "database_edition") else "" 
-                db_info.data_storage_size_gb = db.data_storage_size_in_gbs if hasattr(db, "data_storage_size_in_gbs") else 0
-                db_info.data_storage_size_tb = round(db_info.data_storage_size_gb / 1024, 2)
-                db_info.defined_tags = db.defined_tags
-                db_info.freeform_tags = db.freeform_tags
-                region_summary.db_system_count += 1
-                region_summary.total_storage_gb += db_info.data_storage_size_gb
-                region_summary.total_storage_tb += db_info.data_storage_size_tb
-                compartment_db_list.append(db_info)
-                total_db_systems += 1
-                total_db_system_sizeGB += db_info.data_storage_size_gb
-                total_db_system_sizeTB += db_info.data_storage_size_tb
-            dump_info(filename, "db_systems", compartment_db_list)
+        compartments = get_all_compartments(freeze_config(config))
+    for region_summary, region_db_list in scan_regions(process_database_region, config, regions, compartments):
+        dump_info(report, "db_systems", region_db_list)
         db_summary_list.append(region_summary)
-    write_grand_total(filename, "db_systems")
-    dump_summary(filename, "db_systems", db_summary_list)
-    format_workbook(filename)
+        totals.count += region_summary.db_system_count
+        totals.size_bytes += region_summary.total_storage_bytes
+    write_grand_total(report, "db_systems", totals)
+    dump_summary(report, "db_systems", db_summary_list)
     logging.info("Completed processing all regions and compartments for DB systems.")
-    logging.info(f"Grand Total - DB Systems: {total_db_systems}, Storage (GB): {total_db_system_sizeGB}, Storage (TB): {total_db_system_sizeTB}")
+    logging.info(f"Grand Total - DB Systems: {totals.count}, Storage (GB): {bytes_to_gb(totals.size_bytes)}, Storage (TB): {bytes_to_tb(totals.size_bytes)}")
+    return totals
 
-def get_oke_cluster_info(config, filename, regions=[], compartments=[]):
-    global total_oke_clusters, total_oke_node_count, total_oke_pvc_count
-    global total_oke_pvc_size_gb, total_oke_pvc_size_tb
+def k8s_qty_to_bytes(quantity):
+    number = quantity.rstrip("KMGTPEik")
+    return int(float(number) * K8S_QUANTITY_MULTIPLIERS[quantity[len(number):]])
 
-    oke_summary_list = []
-    identity_client = oci.identity.IdentityClient(config)
+def scan_cluster(cluster, region, profile):
+    from kubernetes import client as kube_client, config as kube_config
 
-    if not regions:
-        regions = [r.region_name for r in identity_client.list_region_subscriptions(config["tenancy"]).data]
-    if not compartments:
-        compartments = [c.id for c in identity_client.list_compartments(
-            compartment_id=config["tenancy"], compartment_id_in_subtree=True).data]
+    node_count, node_names = 0, []
+    pvc_count, pvc_names = 0, []
+    total_pvc_size_bytes = 0
 
-    for region in regions:
-        logging.info(f"Processing OKEs in region: {region}")
-        config["region"] = region
-        container_engine_client = oci.container_engine.ContainerEngineClient(config)
+    try:
+        # A private 0700 directory keeps the bearer-token kubeconfig unreadable to other users and is removed on exit
+        with tempfile.TemporaryDirectory(prefix="cv-oke-") as kubeconfig_dir:
+            kubeconfig_file = os.path.join(kubeconfig_dir, "kubeconfig")
+            with kubeconfig_semaphore:
+                subprocess.run(
+                    [
+                        "oci", "ce", "cluster", "create-kubeconfig",
+                        "--cluster-id", cluster.id,
+                        "--file", kubeconfig_file,
+                        "--region", region,
+                        "--token-version", "2.0.0",
+                        "--kube-endpoint", "PRIVATE_ENDPOINT",
+                        "--profile", profile
+                    ],
+                    check=True,
+                    capture_output=True,
+                    text=True
+                )
 
-        region_summary = OKEClusterSummary()
-        region_summary.region = region
+            logging.info(f"Kubeconfig created at {kubeconfig_file} for cluster {cluster.name}")
 
-        for compartment in compartments:
-            try:
-                clusters = oci.pagination.list_call_get_all_results(
-                    container_engine_client.list_clusters,
-                    compartment_id=compartment
-                ).data
-            except Exception as e:
-                logging.error(f"Error fetching clusters in {compartment}: {e}")
-                continue
+            # A dedicated Configuration per cluster keeps load_kube_config from swapping the process-wide default under other
+            # scan threads. pool_threads=2 lets the PVC and node requests below actually run side by side (the default pool is 1)
+            kube_configuration = kube_client.Configuration()
+            kube_config.load_kube_config(config_file=kubeconfig_file, client_configuration=kube_configuration, persist_config=False)
+            with kube_client.ApiClient(kube_configuration, pool_threads=2) as api_client:
+                core_v1 = kube_client.CoreV1Api(api_client)
+                # Both lists go out together over the shared connection pool instead of paying two round-trips back to back.
+                # _preload_content=False skips the client's slow model deserialization; orjson parses the raw body instead
+                pvc_request = core_v1.list_persistent_volume_claim_for_all_namespaces(async_req=True, _request_timeout=30, _preload_content=False)
+                node_request = core_v1.list_node(async_req=True, _request_timeout=30, _preload_content=False)
+                for pvc in orjson.loads(pvc_request.get().data)["items"]:
+                    metadata = pvc.get("metadata", {})
+                    if not metadata.get("name"):
+                        continue
+                    pvc_count += 1
+                    pvc_names.append(f"{metadata.get('namespace','default')}/{metadata['name']}")
+                    storage = pvc.get("spec", {}).get("resources", {}).get("requests", {}).get("storage")
+                    if storage:
+                        try:
+                            total_pvc_size_bytes += k8s_qty_to_bytes(storage)
+                        except (KeyError, ValueError):
+                            logging.warning(f"Unrecognised storage request {storage} on PVC {metadata.get('name')} in {cluster.name}")
 
-            compartment_oke_list = []
-            for cluster in clusters:
-                if cluster.lifecycle_state == "DELETED":
-                    continue
+                try:
+                    node_names = [node["metadata"]["name"] for node in orjson.loads(node_request.get().data)["items"]]
+                    node_count = len(node_names)
+                except Exception as e:
+                    logging.warning(f"Could not fetch nodes for {cluster.name}: {e}")
+                    node_names = []
+                    node_count = 0
 
-                cluster_info = OKEClusterInfo()
-                cluster_info.region = region
-                cluster_info.cluster_id = cluster.id
-                cluster_info.cluster_name = cluster.name
-                cluster_info.kubernetes_version = cluster.kubernetes_version
+    except Exception as e:
+        logging.warning(f"Error while fetching nodes and pvcs for {cluster.name}: {e}")
 
-                kubeconfig_file = os.path.join(tempfile.gettempdir(), f"kubeconfig_{cluster.id}")
-                try:
-                    subprocess.run(
-                        [
-                            "oci", "ce", "cluster", "create-kubeconfig",
-                            "--cluster-id", cluster.id,
-                            "--file", kubeconfig_file,
-                            "--region", region,
-                            "--token-version", "2.0.0",
-                            "--kube-endpoint", "PRIVATE_ENDPOINT",
-                            "--profile", config.get("profile", oci.config.DEFAULT_PROFILE)
-                        ],
-                        check=True,
-                        capture_output=True,
-                        text=True
-                    )
-
-                    logging.info(f"Kubeconfig created at {kubeconfig_file} for cluster {cluster.name}")
-
-                    result = subprocess.run(
-                        ["kubectl", "--kubeconfig", kubeconfig_file, "get", "pvc", "-A", "-o", "json"],
-                        check=True,
-                        capture_output=True,
-                        text=True
-                    )
-
-                    pvc_data = json.loads(result.stdout)
-                    cluster_info.pvc_count = len([pvc for pvc in pvc_data["items"] if pvc.get("metadata", {}).get("name")])
-                    cluster_info.pvc_names = [
-                        f"{pvc['metadata'].get('namespace','default')}/{pvc['metadata']['name']}"
-                        for pvc in pvc_data["items"]
-                    ]
-                    cluster_info.total_pvc_size_gb = sum([
-                        int(pvc["spec"]["resources"]["requests"]["storage"].replace("Gi", ""))
-                        for pvc in pvc_data["items"]
-                        if "resources" in pvc["spec"] and "storage" in pvc["spec"]["resources"]["requests"]
-                    ])
-                    cluster_info.total_pvc_size_tb = round(cluster_info.total_pvc_size_gb / 1024, 2)
-
-                    try:
-                        node_result = subprocess.run(
-                            ["kubectl", "--kubeconfig", kubeconfig_file, "get", "nodes", "-o", "json"],
-                            check=True,
-                            capture_output=True,
-                            text=True
-                        )
-                        node_data = json.loads(node_result.stdout)
-                        cluster_info.node_names = [n["metadata"]["name"] for n in node_data["items"]]
-                        cluster_info.node_count = len(cluster_info.node_names)
-                    except Exception as e:
-                        logging.warning(f"Could not fetch nodes for {cluster.name}: {e}")
-                        cluster_info.node_names = []
-                        cluster_info.node_count = 0
+    return OKEClusterInfo(
+        region=region,
+        cluster_id=cluster.id,
+        cluster_name=cluster.name,
+        kubernetes_version=cluster.kubernetes_version,
+        node_count=node_count,
+        node_names=node_names,
+        pvc_count=pvc_count,
+        pvc_names=pvc_names,
+        total_pvc_size_bytes=total_pvc_size_bytes,
+    )
 
-                except Exception as e:
-                    logging.warning(f"Error while using kubectl to fetch nodes and pvcs for {cluster.name}: {e}")
-                finally:
-                    try:
-                        os.remove(kubeconfig_file)
-                    except OSError:
-                        pass
+def process_oke_cluster_region(config, compartments, region, profile):
+    logging.info(f"Processing OKEs in region: {region}")
+    region_config = dict(config, region=region)
+    container_engine_client = oci.container_engine.ContainerEngineClient(region_config)
+    compartments = get_compartments_with_resources(region_config, "clusterscluster", compartments, "lifecycleState != 'DELETED'")
 
+    region_summary = OKEClusterSummary()
+    region_summary.region = region
+    region_oke_list = []
 
-                region_summary.cluster_count += 1
-                region_summary.total_node_count += cluster_info.node_count
-                region_summary.total_pvc_count += cluster_info.pvc_count
-                region_summary.total_pvc_size_gb += cluster_info.total_pvc_size_gb
-                region_summary.total_pvc_size_tb += cluster_info.total_pvc_size_tb
+    for compartment in compartments:
+        try:
+            clusters = oci.pagination.list_call_get_all_results(
+                retry_on_throttle()(container_engine_client.list_clusters),
+                compartment_id=compartment,
+                retry_strategy=NO_SDK_RETRY
+            ).data
+        except Exception as e:
+            logging.error(f"Error fetching clusters in {compartment}: {e}")
+            continue
 
-                total_oke_clusters += 1
-                total_oke_node_count += cluster_info.node_count
-                total_oke_pvc_count += cluster_info.pvc_count
-                total_oke_pvc_size_gb += cluster_info.total_pvc_size_gb
-                total_oke_pvc_size_tb += cluster_info.total_pvc_size_tb
+        live_clusters = [cluster for cluster in clusters if cluster.lifecycle_state != "DELETED"]
+        with ThreadPoolExecutor(max_workers=MAX_CLUSTER_WORKERS) as executor:
+            cluster_infos = list(executor.map(partial(scan_cluster, region=region, profile=profile), live_clusters))
 
-                compartment_oke_list.append(cluster_info)
+        for cluster_info in cluster_infos:
+            region_summary.cluster_count += 1
+            region_summary.total_node_count += cluster_info.node_count
+            region_summary.total_pvc_count += cluster_info.pvc_count
+            region_summary.total_pvc_size_bytes += cluster_info.total_pvc_size_bytes
 
-            dump_info(filename, "oke_clusters", compartment_oke_list)
+            region_oke_list.append(cluster_info)
 
+    return region_summary, region_oke_list
+
+def get_oke_cluster_info(config, report, regions=[], compartments=[], profile=oci.config.DEFAULT_PROFILE):
+    totals = OKEClusterTotals()
+    oke_summary_list = []
+
+    if not regions:
+        regions = get_all_regions(freeze_config(config))
+    if not compartments:
+        compartments = get_all_compartments(freeze_config(config))
+
+    for region_summary, region_oke_list in scan_regions(partial(process_oke_cluster_region, profile=profile), config, regions, compartments):
+        dump_info(report, "oke_clusters", region_oke_list)
         oke_summary_list.append(region_summary)
+        totals.count += region_summary.cluster_count
+        totals.node_count += region_summary.total_node_count
+        totals.pvc_count += region_summary.total_pvc_count
+        totals.pvc_size_bytes += region_summary.total_pvc_size_bytes
 
-    write_grand_total(filename, "oke_clusters")
-    dump_summary(filename, "oke_clusters", oke_summary_list)
-    format_workbook(filename)
+    write_grand_total(report, "oke_clusters", totals)
+    dump_summary(report, "oke_clusters", oke_summary_list)
     logging.info("Completed processing OKE clusters.")
     logging.info(
-        f"Grand Total - OKE Clusters: {total_oke_clusters}, "
-        f"Nodes: {total_oke_node_count}, PVCs: {total_oke_pvc_count}, "
-        f"PVC Size (GB): {total_oke_pvc_size_gb}, PVC Size (TB): {total_oke_pvc_size_tb}"
+        f"Grand Total - OKE Clusters: {totals.count}, "
+        f"Nodes: {totals.node_count}, PVCs: {totals.pvc_count}, "
+        f"PVC Size (GB): {bytes_to_gb(totals.pvc_size_bytes)}, PVC Size (TB): {bytes_to_tb(totals.pvc_size_bytes)}"
     )
+    return totals
 
 
+# Handlers share one signature; profile is only consumed by oke_clusters, which passes it to the OCI CLI
+# (oci.config.from_file does not record the profile name in the config dict)
+WORKLOAD_HANDLERS = {
+    "instances": get_instance_info,
+    "object_storage": get_object_storage_info,
+    "db_systems": get_database_info,
+    "oke_clusters": get_oke_cluster_info,
+}
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Collect OCI resource sizing data into an Excel report.")
+    parser.add_argument("--workload", choices=[*WORKLOAD_HANDLERS, "all"], default="all",
+                        help="Type of resource to report. Defaults to all supported workloads.")
+    parser.add_argument("--profile", default=oci.config.DEFAULT_PROFILE, help="OCI config profile name.")
+    parser.add_argument("--region", type=lambda value: value.split(","), default=[],
+                        help="Comma-separated list of regions. Defaults to all subscribed regions.")
+    parser.add_argument("--compartment", type=lambda value: value.split(","), default=[],
+                        help="Comma-separated list of compartment OCIDs. Defaults to all compartments.")
+    args = parser.parse_args()
+    workload, profile_name, regions, compartments = args.workload, args.profile, args.region, args.compartment
 
-    if not shutil.which("kubectl"):
-        logging.error("Error: 'kubectl' command not found. Please install kubectl to proceed.")
-        sys.exit(1)
     if not shutil.which("oci"):
         logging.error("Error: 'oci' CLI not found. Please install OCI CLI to proceed.")
         sys.exit(1)
 
-    packages = ["oci", "openpyxl", "pandas"]
-
-    for pkg in packages:
-        install_and_import(pkg)
-
-    args = sys.argv[1:]
-    for arg in args:
-        if arg.startswith("--profile="):
-            profile_name = arg.split("=")[1]
-        elif arg.startswith("--region="):
-            regions = arg.split("=")[1].split(",")
-        elif arg.startswith("--compartment="):
-            compartments = arg.split("=")[1].split(",")
-        elif arg.startswith("--workload="):
-            workload = arg.split("=")[1]
-        elif arg == "--help":
-            print("Usage: python oci_cs.py [--workload=<instances|object_storage|db_systems|oke_clusters>] [--profile=<profilename>] [--region=<region1>,<region2>] [--compartment=<comp1>,<comp2>] [--help]")
-            sys.exit(0)
-        else:
-            print(f"Unknown argument: {arg}")
-            sys.exit(1)
-
-    if "workload" not in locals():
-        workload = "all"
-    if "profile_name" not in locals():
-        profile_name = oci.config.DEFAULT_PROFILE
-    if "regions" not in locals():
-        regions = []
-    if "compartments" not in locals():
-        compartments = []
     config = oci.config.from_file(profile_name=profile_name)
     timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
     log_dir = "Logs"
@@ -804,30 +1068,13 @@ if __name__ == "__main__":
     metrics_dir = "Metrics"
     os.makedirs(metrics_dir, exist_ok=True)
     filename = os.path.join(metrics_dir, f"{profile_name}_{workload}_{timestamp}.xlsx")
-    if workload == "instances":
-        init_excel(filename,workload)
-        get_instance_info(config, filename, regions, compartments)
-    elif workload == "object_storage":
-        init_excel(filename,workload)
-        get_object_storage_info(config, filename, regions, compartments)
-    elif workload == "db_systems":
-        init_excel(filename,workload)
-        get_database_info(config, filename, regions, compartments)
-    elif workload == "oke_clusters":
-        init_excel(filename, workload)
-        get_oke_cluster_info(config, filename, regions, compartments)
-    elif workload == "all":
+    report = {}
+    if workload == "all":
         logging.info(f"Getting information for all supported workloads.")
-        for wl in ["instances", "object_storage", "db_systems", "oke_clusters"]:
-            init_excel(filename, wl)
-            if wl == "instances":
-                get_instance_info(config, filename, regions, compartments)
-            elif wl == "object_storage":
-                get_object_storage_info(config, filename, regions, compartments)
-            elif wl == "db_systems":
-                get_database_info(config, filename, regions, compartments)
-            elif wl == "oke_clusters":
-                get_oke_cluster_info(config, filename, regions, compartments)
+        workloads = list(WORKLOAD_HANDLERS)
     else:
-        logging.error(f"Unsupported workload specified: {workload}. Supported workloads are: instances, object_storage, db_systems, oke_clusters. If you want to gather information for all workloads, use --workload=all or don't specify the --workload argument at all.")
-        sys.exit(1)
\ No newline at end of file
+        workloads = [workload]
+    for wl in workloads:
+        WORKLOAD_HANDLERS[wl](config, report, regions, compartments, profile_name)
+    save_workbook(filename, report)
+    logging.info(f"Report saved to {filename}")